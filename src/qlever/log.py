@@ -1,23 +1,47 @@
 from __future__ import annotations
 
 import logging
+import os
+import sys
 from contextlib import contextmanager
 
-from termcolor import colored
+# ANSI escape codes for the log levels that are shown in color (the same codes
+# that `termcolor.colored` uses, but without its overhead for each record).
+log_level_colors = {
+    logging.DEBUG: "\033[35m",
+    logging.WARNING: "\033[33m",
+    logging.ERROR: "\033[31m",
+    logging.CRITICAL: "\033[31m",
+}
+
+
+# Whether to use colors, decided like `termcolor.colored` does.
+def colors_enabled():
+    if "ANSI_COLORS_DISABLED" in os.environ or "NO_COLOR" in os.environ:
+        return False
+    if "FORCE_COLOR" in os.environ:
+        return True
+    if os.environ.get("TERM") == "dumb":
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
 
 
 class QleverLogFormatter(logging.Formatter):
     """
     Custom formatter for logging.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.colors = log_level_colors if colors_enabled() else {}
+
     def format(self, record):
         message = record.getMessage()
-        if record.levelno == logging.DEBUG:
-            return colored(f"{message}", "magenta")
-        elif record.levelno == logging.WARNING:
-            return colored(f"{message}", "yellow")
-        elif record.levelno in [logging.CRITICAL, logging.ERROR]:
-            return colored(f"{message}", "red")
+        color = self.colors.get(record.levelno)
+        if color:
+            return f"{color}{message}\033[0m"
         else:
             return message
 
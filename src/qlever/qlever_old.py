@@ -6,7 +6,7 @@
 # for how to use it.
 
 import glob
-import inspect
+import http.client
 import json
 import logging
 import os
@@ -14,23 +14,34 @@ import re
 import shlex
 import shutil
 import socket
+import stat
 import subprocess
 import sys
 import time
 import traceback
+import urllib.parse
+import urllib.request
 from configparser import ConfigParser, ExtendedInterpolation
 from datetime import date, datetime
+from functools import cached_property
 
-import pkg_resources
 import psutil
 
 from qlever.log import log
+from qlever.util import is_port_used
 
 BLUE = "\033[34m"
 RED = "\033[31m"
 BOLD = "\033[1m"
 NORMAL = "\033[0m"
 
+# Where the results of `Actions.cached_probe` are cached.
+INSTALL_PROBE_CACHE = "~/.cache/qlever/install_probe.json"
+
+# Command-line arguments that set the log level or a config value.
+LOG_LEVEL_REGEX = re.compile(r"general\.log_level=(\w+)", re.IGNORECASE)
+SET_CONFIG_REGEX = re.compile(r"(\w+)\.(\w+)=(.*)")
+
 # # Custom formatter for log messages.
 # class CustomFormatter(logging.Formatter):
 #     def format(self, record):
@@ -105,6 +116,152 @@ def show_available_action_names():
     log.info(f"{BLUE}eval \"$(qlever-old setup-autocompletion)\"{NORMAL}")
 
 
+def load_config(path):
+    """
+    Read the Qleverfile at `path` and add the default values for options that
+    are not set explicitly. Returns a `ConfigParser`, so that values are
+    interpolated when they are read (and changes via `Actions.set_config`
+    carry over to the options that depend on them).
+    """
+
+    config = ConfigParser(interpolation=ExtendedInterpolation())
+    files_read = config.read(path)
+    if not files_read:
+        log.error(f"ConfigParser could not read \"{path}\"")
+        abort_script()
+    name = config['data']['name']
+
+    # Defaults for [server] that carry over from [index].
+    for option in ["with_text_index", "only_pso_and_pos_permutations",
+                   "use_patterns"]:
+        if option in config['index'] and option not in config['server']:
+            config['server'][option] = config['index'][option]
+
+    # Default values for options that are not mandatory in the Qleverfile.
+    defaults = {
+        "general": {
+            "log_level": "info",
+            "pid": "0",
+            "example_queries_url": (f"https://qlever.cs.uni-freiburg.de/"
+                                    f"api/examples/"
+                                    f"{config['ui']['config']}"),
+            "example_queries_limit": "10",
+            "example_queries_send": "0",
+        },
+        "index": {
+            "binary": "IndexBuilderMain",
+            "with_text_index": "false",
+            "only_pso_and_pos_permutations": "false",
+            "use_patterns": "true",
+        },
+        "server": {
+            "port": "7000",
+            "binary": "ServerMain",
+            "num_threads": "8",
+            "cache_max_size": "5G",
+            "cache_max_size_single_entry": "1G",
+            "cache_max_num_entries": "100",
+            "with_text_index": "false",
+            "only_pso_and_pos_permutations": "false",
+            "timeout": "30s",
+            "use_patterns": "true",
+            "url": f"http://localhost:{config['server']['port']}",
+        },
+        "docker": {
+            "image": "adfreiburg/qlever",
+            "container_server": f"qlever.server.{name}",
+            "container_indexer": f"qlever.indexer.{name}",
+        },
+        "ui": {
+            "port": "7000",
+            "image": "adfreiburg/qlever-ui",
+            "container": "qlever-ui",
+            "url": "https://qlever.cs.uni-freiburg.de/api",
+
+        }
+    }
+    # Add the default values for all options that do not exist or are empty
+    # in one go (this also creates the sections that do not exist).
+    config.read_dict({
+        section: {option: value for option, value in options.items()
+                  if not config.get(section, option, fallback=None)}
+        for section, options in defaults.items()})
+
+    return config
+
+
+# Check whether docker is installed and works (on MacOS 12, docker hangs when
+# installed without GUI, hence the timeout). Returns `True` if yes and raises
+# an exception with the reason if not (see `Actions.cached_probe`).
+#
+# NOTE: For the small helper commands in this script, we pass the full path of
+# the executable and `close_fds=False`, which lets `subprocess` use the cheaper
+# `posix_spawn` instead of `fork` + `exec`. This is safe because file
+# descriptors opened by Python are not inherited by child processes anyway.
+def docker_works():
+    docker = shutil.which("docker")
+    if docker is None:
+        raise Exception("`docker` not found")
+    completed_process = subprocess.run(
+            [docker, "info"], timeout=0.5, close_fds=False,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if completed_process.returncode != 0:
+        raise Exception(f"exit code {completed_process.returncode}")
+    return True
+
+
+# Get the path and modification time of the given file (as a list, so that it
+# can be part of a JSON key, see `Actions.cached_probe`).
+def path_and_mtime(path):
+    if path is None or not os.path.exists(path):
+        return [path, 0]
+    return [path, os.path.getmtime(path)]
+
+
+# Split the given command line into arguments for `subprocess` (which then
+# runs it without a shell). Like a shell, expand `~` and environment variables
+# in the name of the executable.
+def command_args(cmdline):
+    args = shlex.split(cmdline)
+    args[0] = os.path.expanduser(os.path.expandvars(args[0]))
+    return args
+
+
+# Check whether the given QLever binary exists and works. Returns `True` if yes
+# and raises an exception with the reason if not. The binary is run just like
+# action `start` runs it (see `command_args`).
+def binary_works(binary):
+    subprocess.run(command_args(binary) + ["--help"], check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return True
+
+
+# Iterate over the processes that may be QLever processes, as `psutil.Process`
+# objects. On Linux, first check the cheap `/proc/<pid>/comm` (the executable
+# name, truncated to 15 characters by the kernel) and only create a
+# `psutil.Process` for the processes that match. Elsewhere, fall back to
+# iterating over all processes.
+def iter_qlever_processes(binaries=("ServerMain", "IndexBuilderMain")):
+    if not sys.platform.startswith("linux") or not os.path.isdir("/proc"):
+        yield from psutil.process_iter()
+        return
+    comms = {binary[:15] for binary in binaries}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm") as comm_file:
+                comm = comm_file.read().rstrip("\n")
+        except OSError:
+            continue
+        if comm not in comms:
+            continue
+        try:
+            yield psutil.Process(int(pid))
+        except psutil.Error:
+            continue
+
+
 # We want to distinguish between exception that we throw intentionally and all
 # others.
 class ActionException(Exception):
@@ -115,7 +272,6 @@ class ActionException(Exception):
 class Actions:
 
     def __init__(self):
-        self.config = ConfigParser(interpolation=ExtendedInterpolation())
         # Check if the Qleverfile exists.
         if not os.path.isfile("Qleverfile"):
             log.setLevel(logging.INFO)
@@ -128,73 +284,10 @@ class Actions:
             log.info("")
             show_available_config_names()
             abort_script()
-        files_read = self.config.read("Qleverfile")
-        if not files_read:
-            log.error("ConfigParser could not read \"Qleverfile\"")
-            abort_script()
+        self.config = load_config("Qleverfile")
         self.name = self.config['data']['name']
         self.yes_values = ["1", "true", "yes"]
 
-        # Defaults for [server] that carry over from [index].
-        for option in ["with_text_index", "only_pso_and_pos_permutations",
-                       "use_patterns"]:
-            if option in self.config['index'] and \
-                    option not in self.config['server']:
-                self.config['server'][option] = \
-                    self.config['index'][option]
-
-        # Default values for options that are not mandatory in the Qleverfile.
-        defaults = {
-            "general": {
-                "log_level": "info",
-                "pid": "0",
-                "example_queries_url": (f"https://qlever.cs.uni-freiburg.de/"
-                                        f"api/examples/"
-                                        f"{self.config['ui']['config']}"),
-                "example_queries_limit": "10",
-                "example_queries_send": "0",
-            },
-            "index": {
-                "binary": "IndexBuilderMain",
-                "with_text_index": "false",
-                "only_pso_and_pos_permutations": "false",
-                "use_patterns": "true",
-            },
-            "server": {
-                "port": "7000",
-                "binary": "ServerMain",
-                "num_threads": "8",
-                "cache_max_size": "5G",
-                "cache_max_size_single_entry": "1G",
-                "cache_max_num_entries": "100",
-                "with_text_index": "false",
-                "only_pso_and_pos_permutations": "false",
-                "timeout": "30s",
-                "use_patterns": "true",
-                "url": f"http://localhost:{self.config['server']['port']}",
-            },
-            "docker": {
-                "image": "adfreiburg/qlever",
-                "container_server": f"qlever.server.{self.name}",
-                "container_indexer": f"qlever.indexer.{self.name}",
-            },
-            "ui": {
-                "port": "7000",
-                "image": "adfreiburg/qlever-ui",
-                "container": "qlever-ui",
-                "url": "https://qlever.cs.uni-freiburg.de/api",
-
-            }
-        }
-        for section in defaults:
-            # If the section does not exist, create it.
-            if not self.config.has_section(section):
-                self.config[section] = {}
-            # If an option does not exist, set it to the default value.
-            for option in defaults[section]:
-                if not self.config[section].get(option):
-                    self.config[section][option] = defaults[section][option]
-
         # If the log level was not explicitly set by the first command-line
         # argument (see below), set it according to the Qleverfile.
         if log.level == logging.NOTSET:
@@ -205,43 +298,119 @@ class Actions:
                 log.error(f"Invalid log level: \"{log_level}\"")
                 abort_script()
 
-        # Show some information (for testing purposes only).
-        log.debug(f"Parsed Qleverfile, sections are: "
-                  f"{', '.join(self.config.sections())}")
+        # Show some information (for testing purposes only). The check avoids
+        # building the message when it is not shown anyway.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Parsed Qleverfile, sections are: %s",
+                      ", ".join(self.config.sections()))
+
+        # HTTP connections used by `alive_check`, by port.
+        self.alive_check_connections = {}
 
-        # Check specifics of the installation.
-        self.check_installation()
+        # Why the checks of `cached_probe` failed, by name of the check.
+        self.probe_errors = {}
 
-    def check_installation(self):
+    # The specifics of the installation are properties that are only checked
+    # when an action first needs them (and then remembered). For example, the
+    # action `status` needs none of them, and `start` needs only the server
+    # binary (and not even that with docker.USE_DOCKER=true).
+
+    @cached_property
+    def docker_enabled(self):
         """
-        Helper function that checks particulars of the installation and
-        remembers them so that all actions execute without errors.
+        Whether docker is installed and works.
         """
 
-        # Handle the case Systems like macOS do not allow
-        # psutil.net_connections().
-        try:
-            psutil.net_connections()
-            self.net_connections_enabled = True
-        except Exception as e:
-            self.net_connections_enabled = False
-            log.debug(f"Note: psutil.net_connections() failed ({e}),"
-                      f" will not scan network connections for action"
-                      f" \"start\"")
+        docker_enabled = self.cached_probe(
+                "docker", [path_and_mtime(shutil.which("docker")),
+                           path_and_mtime("/var/run/docker.sock")],
+                docker_works)
+        if not docker_enabled:
+            print(f"Note: `docker info` failed "
+                  f"({self.probe_errors.get('docker')}), therefore"
+                  f" docker.USE_DOCKER=true not supported")
+        return docker_enabled
+
+    @cached_property
+    def index_binary_works(self):
+        """
+        Whether the binary for building the index exists and works.
+        """
+
+        return self.cached_binary_probe("index")
 
-        # Check whether docker is installed and works (on MacOS 12, docker
-        # hangs when installed without GUI, hence the timeout).
+    @cached_property
+    def server_binary_works(self):
+        """
+        Whether the binary for starting the server exists and works.
+        """
+
+        return self.cached_binary_probe("server")
+
+    def cached_binary_probe(self, section):
+        """
+        Helper function that checks whether `{section}.BINARY` exists and
+        works, cached via `cached_probe`.
+        """
+
+        binary = self.config[section]['binary']
+        executable = os.path.expanduser(os.path.expandvars(binary))
+        return self.cached_probe(
+                f"{section}_binary",
+                [binary, path_and_mtime(shutil.which(executable))],
+                lambda: binary_works(binary))
+
+    def cached_probe(self, name, key, probe):
+        """
+        Helper function that returns the result of `probe()`, or `False` if
+        it raises an exception (the reason is then remembered in
+        `self.probe_errors[name]`). A successful
+        result is cached under `name` in `INSTALL_PROBE_CACHE` together with
+        the given `key`, and used as long as the key does not change. The key
+        should change when the installation changes (for example, the paths
+        and modification times of the involved files). Failed results are not
+        cached, because the cause of a failure (a missing shared library, a
+        docker daemon that is not running yet, a timeout) can go away without
+        any change of the key.
+        """
+
+        # Use the cached result if the key has not changed. Entries that are
+        # not of the expected form (for example, from an older version of this
+        # script) are dropped.
+        probe_cache_path = os.path.expanduser(INSTALL_PROBE_CACHE)
         try:
-            completed_process = subprocess.run(
-                    ["docker", "info"], timeout=0.5,
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            if completed_process.returncode != 0:
-                raise Exception("docker info failed")
-            self.docker_enabled = True
+            with open(probe_cache_path) as probe_cache_file:
+                probe_cache = {
+                    entry_name: entry for entry_name, entry
+                    in json.load(probe_cache_file).items()
+                    if isinstance(entry, dict) and "key" in entry
+                    and entry.get("result") is True}
         except Exception:
-            self.docker_enabled = False
-            print("Note: `docker info` failed, therefore"
-                  " docker.USE_DOCKER=true not supported")
+            probe_cache = {}
+        if name in probe_cache and probe_cache[name]["key"] == key:
+            log.debug(f"Check \"{name}\" succeeded before, according to "
+                      f"\"{probe_cache_path}\" (delete that file to run "
+                      f"the check again)")
+            return True
+
+        # Otherwise, run the probe and, if it succeeds, write the result to the
+        # cache (failing to do so is not an error).
+        try:
+            result = probe()
+        except Exception as e:
+            log.debug(f"Check \"{name}\" failed: {e}")
+            self.probe_errors[name] = str(e)
+            result = False
+        if not result:
+            return result
+        probe_cache[name] = {"key": key, "result": True}
+        try:
+            os.makedirs(os.path.dirname(probe_cache_path), exist_ok=True)
+            with open(probe_cache_path, "w") as probe_cache_file:
+                json.dump(probe_cache, probe_cache_file)
+        except Exception as e:
+            log.debug(f"Could not write \"{probe_cache_path}\": {e}")
+        return result
 
     def set_config(self, section, option, value):
         """
@@ -266,8 +435,19 @@ class Actions:
 
         total_size = 0
         for path in paths:
+            # A path without wildcards (the common case) needs just one `stat`.
+            if not any(c in path for c in "*?["):
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(stat_result.st_mode):
+                    total_size += stat_result.st_size
+                continue
+            # Patterns are expanded with `glob` (directories are skipped).
             for file in glob.glob(path):
-                total_size += os.path.getsize(file)
+                if os.path.isfile(file):
+                    total_size += os.path.getsize(file)
         return total_size / 1e9
 
     def alive_check(self, port):
@@ -276,12 +456,21 @@ class Actions:
         port.
         """
 
+        # Reuse one HTTP connection per port (for repeated checks while
+        # waiting for the server to start). After a failure, the connection
+        # is closed and the next request opens a new one.
+        if port not in self.alive_check_connections:
+            self.alive_check_connections[port] = \
+                http.client.HTTPConnection("localhost", int(port), timeout=5)
+        connection = self.alive_check_connections[port]
         message = "from the qlever script".replace(" ", "%20")
-        curl_cmd = f"curl -s http://localhost:{port}/ping?msg={message}"
-        exit_code = subprocess.call(curl_cmd, shell=True,
-                                    stdout=subprocess.DEVNULL,
-                                    stderr=subprocess.DEVNULL)
-        return exit_code == 0
+        try:
+            connection.request("GET", f"/ping?msg={message}")
+            connection.getresponse().read()
+            return True
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return False
 
     def show_process_info(self, psutil_process,
                           cmdline_regex, show_heading=True):
@@ -290,17 +479,32 @@ class Actions:
         about the process can be retrieved and the command line matches the
         given regex (in which case the function returns `True`). The heading is
         only shown if `show_heading` is `True` and the function returns `True`.
+        The regex can be a string or a compiled pattern.
+        """
+
+        lines = self.get_process_info_lines(psutil_process, cmdline_regex,
+                                            show_heading=show_heading)
+        if not lines:
+            return False
+        log.info("\n".join(lines))
+        return True
+
+    def get_process_info_lines(self, psutil_process,
+                               cmdline_regex, show_heading=True):
+        """
+        Helper function that returns the lines of the process table shown by
+        `show_process_info` (and an empty list if nothing would be shown).
         """
 
-        def show_table_line(pid, user, start_time, rss, cmdline):
-            log.info(f"{pid:<8} {user:<8} {start_time:>5}  {rss:>5} {cmdline}")
+        def table_line(pid, user, start_time, rss, cmdline):
+            return f"{pid:<8} {user:<8} {start_time:>5}  {rss:>5} {cmdline}"
         try:
             pinfo = psutil_process.as_dict(
                     attrs=['pid', 'username', 'create_time',
                            'memory_info', 'cmdline'])
             cmdline = " ".join(pinfo['cmdline'])
             if not re.search(cmdline_regex, cmdline):
-                return False
+                return []
             pid = pinfo['pid']
             user = pinfo['username'] if pinfo['username'] else ""
             start_time = datetime.fromtimestamp(pinfo['create_time'])
@@ -309,13 +513,15 @@ class Actions:
             else:
                 start_time = start_time.strftime("%b%d")
             rss = f"{pinfo['memory_info'].rss / 1e9:.0f}G"
+            lines = []
             if show_heading:
-                show_table_line("PID", "USER", "START", "RSS", "COMMAND")
-            show_table_line(pid, user, start_time, rss, cmdline)
-            return True
+                lines.append(table_line("PID", "USER", "START", "RSS",
+                                        "COMMAND"))
+            lines.append(table_line(pid, user, start_time, rss, cmdline))
+            return lines
         except Exception as e:
-            log.debug(f"Could not get process info: {e}")
-            return False
+            log.debug("Could not get process info: %s", e)
+            return []
 
     def show(self, action_description, only_show):
         """
@@ -384,19 +590,20 @@ class Actions:
         values for options that are not set explicitly in the Qleverfile.
         """
 
-        print(f"{BLUE}Showing the current configuration, including default"
-              f" values for options that are not set explicitly in the"
-              f" Qleverfile{NORMAL}")
+        # Collect all lines and write them at once.
+        lines = [f"{BLUE}Showing the current configuration, including default"
+                 f" values for options that are not set explicitly in the"
+                 f" Qleverfile{NORMAL}"]
         for section in self.config.sections():
-            print()
-            print(f"[{section}]")
-            max_option_length = max([len(option) for option in
-                                     self.config[section]])
-            for option in self.config[section]:
-                print(f"{option.upper().ljust(max_option_length)} = "
-                      f"{self.config[section][option]}")
-
-        print()
+            lines.append("")
+            lines.append(f"[{section}]")
+            options = list(self.config[section].items())
+            max_option_length = max((len(option) for option, _ in options),
+                                    default=0)
+            lines.extend(f"{option.upper().ljust(max_option_length)} = "
+                         f"{value}" for option, value in options)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @track_action_rank
     def action_get_data(self, only_show=False):
@@ -478,13 +685,10 @@ class Actions:
         # When docker.USE_DOCKER=false, check if the binary for building the
         # index exists and works.
         if self.config['docker']['use_docker'] not in self.yes_values:
-            try:
+            if not self.index_binary_works:
                 check_binary_cmd = f"{self.config['index']['binary']} --help"
-                subprocess.run(check_binary_cmd, shell=True, check=True,
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            except subprocess.CalledProcessError as e:
-                log.error(f"Running \"{check_binary_cmd}\" failed ({e}), "
+                log.error(f"Running \"{check_binary_cmd}\" failed "
+                          f"({self.probe_errors.get('index_binary')}), "
                           f"set index.BINARY to a different binary or "
                           f"set docker.USE_DOCKER=true")
                 abort_script()
@@ -567,7 +771,9 @@ class Actions:
                  "from_literals",
                  "from_text_records_and_literals"]:
             cmdline += " -t"
-        cmdline += f" > {self.name}.server-log.txt 2>&1"
+        server_cmdline = cmdline
+        server_log = f"{self.name}.server-log.txt"
+        cmdline += f" > {server_log} 2>&1"
 
         # If we are using Docker, run the command in a docker container.
         if self.config['docker']['use_docker'] in self.yes_values:
@@ -594,13 +800,10 @@ class Actions:
         # When docker.USE_DOCKER=false, check if the binary for starting the
         # server exists and works.
         if self.config['docker']['use_docker'] not in self.yes_values:
-            try:
+            if not self.server_binary_works:
                 check_binary_cmd = f"{self.config['server']['binary']} --help"
-                subprocess.run(check_binary_cmd, shell=True, check=True,
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            except subprocess.CalledProcessError as e:
-                log.error(f"Running \"{check_binary_cmd}\" failed ({e}), "
+                log.error(f"Running \"{check_binary_cmd}\" failed "
+                          f"({self.probe_errors.get('server_binary')}), "
                           f"set server.BINARY to a different binary or "
                           f"set docker.USE_DOCKER=true")
                 abort_script()
@@ -611,48 +814,73 @@ class Actions:
             raise ActionException(
                     f"QLever server already running on port {port}")
 
-        # Check if another process is already listening.
-        if self.net_connections_enabled:
-            if port in [conn.laddr.port for conn
-                        in psutil.net_connections()]:
-                raise ActionException(
-                        f"Port {port} is already in use by another process")
+        # Check if another process is already listening (by trying to bind
+        # to the port, which works on all systems and is much cheaper than
+        # scanning all network connections).
+        if is_port_used(int(port)):
+            raise ActionException(
+                    f"Port {port} is already in use by another process")
 
-        # Execute the command line.
-        subprocess.run(cmdline, shell=True,
-                       stdout=subprocess.DEVNULL,
-                       stderr=subprocess.DEVNULL)
+        # Execute the command line. Without docker, start the server directly
+        # instead of via `nohup` in a shell (the new session detaches the
+        # server from the terminal, just like `nohup ... &`), and remember the
+        # process, so that we notice when it exits right away.
+        server_proc = None
+        if self.config['docker']['use_docker'] in self.yes_values:
+            subprocess.run(cmdline, shell=True,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+        else:
+            with open(server_log, "w") as server_log_file:
+                try:
+                    server_proc = subprocess.Popen(
+                            command_args(server_cmdline),
+                            stdin=subprocess.DEVNULL,
+                            stdout=server_log_file,
+                            stderr=subprocess.STDOUT,
+                            start_new_session=True)
+                except (OSError, ValueError) as e:
+                    raise ActionException(
+                            f"Could not start the server with "
+                            f"\"{server_cmdline}\": {e}")
 
-        # Tail the server log until the server is ready (note that the `exec`
-        # is important to make sure that the tail process is killed and not
-        # just the bash process).
+        # Tail the server log until the server is ready (`tail` is started
+        # directly, without a shell, so that terminating `tail_proc` really
+        # terminates the tail process).
         log.info(f"Follow {self.name}.server-log.txt until the server is ready"
                  f" (Ctrl-C stops following the log, but not the server)")
         log.info("")
-        tail_cmd = f"exec tail -f {self.name}.server-log.txt"
-        tail_proc = subprocess.Popen(tail_cmd, shell=True)
+        tail_proc = subprocess.Popen(
+                [shutil.which("tail") or "tail", "-f", server_log],
+                close_fds=False)
         while not self.alive_check(port):
-            time.sleep(1)
+            if server_proc is not None and server_proc.poll() is not None:
+                tail_proc.terminate()
+                raise ActionException(
+                        f"The server exited with exit code "
+                        f"{server_proc.returncode} before it was ready, "
+                        f"see {server_log}")
+            time.sleep(0.1)
 
-        # Set the access token if specified.
+        # Set the index and text description if specified (this requires the
+        # access token).
         access_token = server_config['access_token']
-        access_arg = f"--data-urlencode \"access-token={access_token}\""
-        if "index_description" in self.config['data']:
-            desc = self.config['data']['index_description']
-            curl_cmd = (f"curl -Gs http://localhost:{port}/api"
-                        f" --data-urlencode \"index-description={desc}\""
-                        f" {access_arg} > /dev/null")
-            log.debug(curl_cmd)
-            subprocess.run(curl_cmd, shell=True)
-        if "text_description" in self.config['data']:
-            desc = self.config['data']['text_description']
-            curl_cmd = (f"curl -Gs http://localhost:{port}/api"
-                        f" --data-urlencode \"text-description={desc}\""
-                        f" {access_arg} > /dev/null")
-            log.debug(curl_cmd)
-            subprocess.run(curl_cmd, shell=True)
-
-        # Kill the tail process. NOTE: `tail_proc.kill()` does not work.
+        for option in ["index_description", "text_description"]:
+            if option not in self.config['data']:
+                continue
+            params = {option.replace("_", "-"): self.config['data'][option],
+                      "access-token": access_token}
+            query = urllib.parse.urlencode(params,
+                                           quote_via=urllib.parse.quote)
+            url = f"http://localhost:{port}/api?{query}"
+            log.debug(url)
+            try:
+                with urllib.request.urlopen(url) as response:
+                    response.read()
+            except OSError as e:
+                log.error(f"Could not set {option}: {e}")
+
+        # Stop the tail process.
         tail_proc.terminate()
 
     @track_action_rank
@@ -665,8 +893,12 @@ class Actions:
 
         # Show action description.
         docker_container_name = self.config['docker']['container_server']
-        cmdline_regex = (f"ServerMain.* -i [^ ]*{self.name}")
-        self.show(f"Checking for process matching \"{cmdline_regex}\" "
+        # The server binary as action `start` runs it (see `command_args`).
+        server_binary = command_args(self.config['server']['binary'])[0]
+        cmdline_regex = re.compile(f"{re.escape(server_binary)}.* -i [^ ]*"
+                                   f"{re.escape(self.name)}")
+        self.show(f"Checking for process matching "
+                  f"\"{cmdline_regex.pattern}\" "
                   f"and for Docker container with name "
                   f"\"{docker_container_name}\"", only_show)
         if only_show:
@@ -677,9 +909,12 @@ class Actions:
             docker_cmd = (f"docker stop {docker_container_name} && "
                           f"docker rm {docker_container_name}")
             try:
-                subprocess.run(docker_cmd, shell=True, check=True,
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
+                docker = shutil.which("docker") or "docker"
+                for docker_args in [[docker, "stop", docker_container_name],
+                                    [docker, "rm", docker_container_name]]:
+                    subprocess.run(docker_args, check=True, close_fds=False,
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
                 log.info(f"Docker container with name "
                          f"\"{docker_container_name}\" "
                          f"stopped and removed")
@@ -691,15 +926,17 @@ class Actions:
         #
         # NOTE: On MacOS, some of the proc's returned by psutil.process_iter()
         # no longer exist when we try to access them, so we just skip them.
-        for proc in psutil.process_iter():
+        server_binaries = (os.path.basename(server_binary),)
+        for proc in iter_qlever_processes(binaries=server_binaries):
             try:
                 pinfo = proc.as_dict(
                         attrs=['pid', 'username', 'create_time',
                                'memory_info', 'cmdline'])
                 cmdline = " ".join(pinfo['cmdline'])
             except Exception as err:
-                log.debug(f"Error getting process info: {err}")
-            if re.match(cmdline_regex, cmdline):
+                log.debug("Error getting process info: %s", err)
+                continue
+            if cmdline_regex.match(cmdline):
                 log.info(f"Found process {pinfo['pid']} from user "
                          f"{pinfo['username']} with command line: {cmdline}")
                 print()
@@ -752,7 +989,8 @@ class Actions:
         log.info(f"Follow {self.name}.server-log.txt (Ctrl-C stops"
                  f" following the log, but not the server)")
         log.info("")
-        subprocess.run(log_cmd, shell=True)
+        subprocess.run([shutil.which("tail") or "tail", "-f", "-n", "50",
+                        f"{self.name}.server-log.txt"], close_fds=False)
 
     @track_action_rank
     def action_status(self, only_show=False):
@@ -763,23 +1001,27 @@ class Actions:
         """
 
         # Show action description.
-        cmdline_regex = "(ServerMain|IndexBuilderMain)"
+        cmdline_regex = re.compile("(ServerMain|IndexBuilderMain)")
         # cmdline_regex = f"(ServerMain|IndexBuilderMain).*{self.name}"
         self.show(f"{BLUE}Show all processes on this machine where "
-                  f"the command line matches {cmdline_regex}"
+                  f"the command line matches {cmdline_regex.pattern}"
                   f" using Python's psutil library", only_show)
         if only_show:
             return
 
-        # Show the results as a table.
-        num_processes_found = 0
-        for proc in psutil.process_iter():
-            show_heading = num_processes_found == 0
-            process_shown = self.show_process_info(proc, cmdline_regex,
-                                                   show_heading=show_heading)
-            if process_shown:
-                num_processes_found += 1
-        if num_processes_found == 0:
+        # Show the results as a table (collect the lines and show them at
+        # once).
+        # Also look for the configured binaries, which may have other names.
+        binaries = {"ServerMain", "IndexBuilderMain"} | {
+            os.path.basename(command_args(self.config[section]['binary'])[0])
+            for section in ["server", "index"]}
+        lines = []
+        for proc in iter_qlever_processes(binaries=binaries):
+            lines.extend(self.get_process_info_lines(
+                proc, cmdline_regex, show_heading=len(lines) == 0))
+        if lines:
+            log.info("\n".join(lines))
+        else:
             print("No processes found")
 
     @track_action_rank
@@ -1312,50 +1554,45 @@ def setup_autocompletion_cmd():
     TODO: Currently works for bash only.
     """
 
-    # Get methods that start wth "action_" from the Actions class, sorted by
-    # their appearance in the class (see the `@track_action_rank` decorator).
-    methods = inspect.getmembers(Actions, predicate=inspect.isfunction)
-    methods = [m for m in methods if m[0].startswith("action_")]
-    action_names = sorted([m[0] for m in methods],
-                          key=lambda m: getattr(Actions, m).rank)
-    action_names = [_.replace("action_", "") for _ in action_names]
-    action_names = [_.replace("_", "-") for _ in action_names]
-    action_names = " ".join(action_names)
-
     # Add config settings to the list of possible actions for autocompletion.
-    action_names += " docker.USE_DOCKER=true docker.USE_DOCKER=false"
-    action_names += " index.BINARY=IndexBuilderMain"
-    action_names += " server.BINARY=ServerMain"
+    completions = " ".join(action_names)
+    completions += " docker.USE_DOCKER=true docker.USE_DOCKER=false"
+    completions += " index.BINARY=IndexBuilderMain"
+    completions += " server.BINARY=ServerMain"
 
     # Return multiline string with the command for setting up autocompletion.
     return f"""\
 _qlever_old_completion() {{
   local cur=${{COMP_WORDS[COMP_CWORD]}}
-  COMPREPLY=( $(compgen -W "{action_names}" -- $cur) )
+  COMPREPLY=( $(compgen -W "{completions}" -- $cur) )
 }}
 complete -o nosort -F _qlever_old_completion qlever-old
 """
 
 
-# Get all action names.
-action_names = [_ for _ in dir(Actions) if _.startswith("action_")]
-action_names = [_.replace("action_", "") for _ in action_names]
-action_names = [_.replace("_", "-") for _ in action_names]
+# Get all action names (once, when the module is loaded), sorted by their
+# appearance in the class (see the `@track_action_rank` decorator).
+action_names = tuple(
+        name[len("action_"):].replace("_", "-") for name in sorted(
+            (name for name in vars(Actions) if name.startswith("action_")),
+            key=lambda name: getattr(Actions, name).rank))
 
 
 def main():
-    # Get the version.
-    try:
-        version = pkg_resources.get_distribution("qlever").version
-    except Exception as e:
-        log.error(f"Could not determine package version: {e}")
-        version = "unknown"
     # If the script is called without argument, say hello and provide some
     # help to get started.
     if len(sys.argv) == 1 or \
             (len(sys.argv) == 2 and sys.argv[1] == "help") or \
             (len(sys.argv) == 2 and sys.argv[1] == "--help") or \
             (len(sys.argv) == 2 and sys.argv[1] == "-h"):
+        # Get the version (`pkg_resources` is slow to import, so only do this
+        # when we need it).
+        try:
+            import pkg_resources
+            version = pkg_resources.get_distribution("qlever").version
+        except Exception as e:
+            log.error(f"Could not determine package version: {e}")
+            version = "unknown"
         log.info("")
         log.info(f"{BOLD}Hello, I am the OLD qlever script"
                  f" (version {version}){NORMAL}")
@@ -1390,8 +1627,7 @@ def main():
     # take the log level from the config file).
     log.setLevel(logging.NOTSET)
     if len(sys.argv) > 1:
-        set_log_level_match = re.match(r"general.log_level=(\w+)",
-                                       sys.argv[1], re.IGNORECASE)
+        set_log_level_match = LOG_LEVEL_REGEX.match(sys.argv[1])
         if set_log_level_match:
             log_level = set_log_level_match.group(1).upper()
             sys.argv = sys.argv[1:]
@@ -1453,7 +1689,7 @@ def main():
     # Execute the actions specified on the command line.
     for action_name in sys.argv[1:]:
         # If the action is of the form section.key=value, set the config value.
-        set_config_match = re.match(r"(\w+)\.(\w+)=(.*)", action_name)
+        set_config_match = SET_CONFIG_REGEX.match(action_name)
         if set_config_match:
             section, option, value = set_config_match.groups()
             log.info(f"Setting config value: {section}.{option}={value}")
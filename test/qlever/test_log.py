@@ -0,0 +1,26 @@
+import logging
+
+from qlever.log import QleverLogFormatter
+
+
+def format_warning(monkeypatch, env):
+    for name in ["ANSI_COLORS_DISABLED", "NO_COLOR", "FORCE_COLOR", "TERM"]:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    record = logging.LogRecord("qlever", logging.WARNING, __file__, 1,
+                               "careful", None, None)
+    return QleverLogFormatter().format(record)
+
+
+def test_formatter_colors(monkeypatch):
+    # Under pytest, stdout is not a terminal, so there are no colors unless
+    # they are forced.
+    assert format_warning(monkeypatch, {}) == "careful"
+    assert format_warning(monkeypatch, {"FORCE_COLOR": "1"}) == \
+        "\033[33mcareful\033[0m"
+    assert format_warning(monkeypatch, {"FORCE_COLOR": "1",
+                                        "NO_COLOR": "1"}) == "careful"
+    assert format_warning(monkeypatch, {"FORCE_COLOR": "1",
+                                        "ANSI_COLORS_DISABLED": "1"}) \
+        == "careful"
@@ -0,0 +1,159 @@
+import qlever.qlever_old
+from qlever.qlever_old import Actions, command_args, load_config
+
+QLEVERFILE = """\
+[data]
+NAME = imdb
+
+[index]
+INPUT_FILES = ${data:NAME}.ttl
+CAT_INPUT_FILES = cat ${INPUT_FILES}
+
+[server]
+PORT = 7001
+ACCESS_TOKEN = ${data:NAME}_x
+
+[ui]
+CONFIG = imdb
+"""
+
+
+def write_qleverfile(directory, content=QLEVERFILE):
+    path = directory / "Qleverfile"
+    path.write_text(content)
+    return path
+
+
+def test_load_config_adds_defaults(tmp_path):
+    path = write_qleverfile(tmp_path)
+    config = load_config(str(path))
+    assert config["index"]["cat_input_files"] == "cat imdb.ttl"
+    assert config["server"]["port"] == "7001"
+    assert config["server"]["binary"] == "ServerMain"
+    assert config["docker"]["container_server"] == "qlever.server.imdb"
+
+
+def test_set_config_propagates_to_dependent_options(tmp_path, monkeypatch):
+    write_qleverfile(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    actions = Actions()
+    actions.set_config("index", "INPUT_FILES", "other.ttl")
+    actions.set_config("data", "NAME", "foo")
+    assert actions.config["index"]["cat_input_files"] == "cat other.ttl"
+    assert actions.config["server"]["access_token"] == "foo_x"
+
+
+def test_load_config_reads_values_lazily(tmp_path, monkeypatch):
+    # A value with invalid interpolation syntax only fails when it is read,
+    # all other actions still work.
+    write_qleverfile(tmp_path, QLEVERFILE.replace(
+        "NAME = imdb\n", "NAME = imdb\nDESCRIPTION = costs $5\n"))
+    monkeypatch.chdir(tmp_path)
+    actions = Actions()
+    assert actions.config["server"]["port"] == "7001"
+    assert actions.config.get("data", "description", raw=True) == "costs $5"
+
+
+def test_get_total_file_size(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "a.ttl").write_bytes(b"x" * 1000)
+    (tmp_path / "d" / "b.ttl").write_bytes(b"x" * 500)
+    (tmp_path / "d" / ".hidden.ttl").write_bytes(b"x" * 7)
+    (tmp_path / "d" / "sub.ttl").mkdir()
+    (tmp_path / "d" / "link.ttl").symlink_to("a.ttl")
+    actions = Actions.__new__(Actions)
+
+    def size(paths):
+        return round(actions.get_total_file_size(paths) * 1e9)
+
+    # Plain file names, including a symlink (which counts with the size of
+    # its target) and names that do not exist.
+    assert size(["d/a.ttl"]) == 1000
+    assert size(["d/link.ttl"]) == 1000
+    assert size(["d/missing.ttl", "missing/a.ttl"]) == 0
+    # Patterns: hidden files only match explicitly, directories are skipped.
+    assert size(["d/*.ttl"]) == 2500
+    assert size(["d/[b]*"]) == 500
+    assert size(["d/.*"]) == 7
+    assert size(["*/*.ttl"]) == 2500
+    assert size(["missing/*"]) == 0
+    # Directories given by name are skipped.
+    assert size(["d"]) == 0
+
+
+def test_cached_probe_caches_only_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(qlever.qlever_old, "INSTALL_PROBE_CACHE",
+                        str(tmp_path / "cache" / "install_probe.json"))
+    actions = Actions.__new__(Actions)
+    calls = []
+
+    def probe(result):
+        calls.append(result)
+        return result
+
+    # A failed probe is not cached and runs again next time.
+    assert not actions.cached_probe("docker", ["key"], lambda: probe(False))
+    assert not actions.cached_probe("docker", ["key"], lambda: probe(False))
+    assert calls == [False, False]
+    # A successful probe is cached as long as the key does not change.
+    assert actions.cached_probe("docker", ["key"], lambda: probe(True))
+    assert actions.cached_probe("docker", ["key"], lambda: probe(False))
+    assert calls == [False, False, True]
+    assert not actions.cached_probe("docker", ["new key"],
+                                    lambda: probe(False))
+    assert calls == [False, False, True, False]
+
+
+def test_command_args_expands_executable(monkeypatch):
+    monkeypatch.setenv("HOME", "/home/qlever")
+    monkeypatch.setenv("QLEVER_BUILD", "/opt/build")
+    assert command_args("~/build/ServerMain -i x") == [
+        "/home/qlever/build/ServerMain", "-i", "x"]
+    assert command_args("$QLEVER_BUILD/ServerMain -a '$token'") == [
+        "/opt/build/ServerMain", "-a", "$token"]
+
+
+def test_stop_finds_server_with_expanded_binary(tmp_path, monkeypatch):
+    write_qleverfile(tmp_path, QLEVERFILE.replace(
+        "PORT = 7001\n", "PORT = 7001\nBINARY = ~/build/ServerMain\n"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", "/home/qlever")
+    actions = Actions()
+    actions.docker_enabled = False
+    killed = []
+
+    class FakeProcess:
+        def as_dict(self, attrs):
+            return {"pid": 42, "username": "qlever", "cmdline": [
+                "/home/qlever/build/ServerMain", "-i", "imdb", "-p", "7001"]}
+
+        def kill(self):
+            killed.append(42)
+
+    def fake_iter_qlever_processes(binaries):
+        assert binaries == ("ServerMain",)
+        yield FakeProcess()
+
+    monkeypatch.setattr(qlever.qlever_old, "iter_qlever_processes",
+                        fake_iter_qlever_processes)
+    actions.action_stop()
+    assert killed == [42]
+
+
+def test_status_includes_configured_binaries(tmp_path, monkeypatch):
+    write_qleverfile(tmp_path, QLEVERFILE.replace(
+        "PORT = 7001\n", "PORT = 7001\nBINARY = ~/ServerMain-debug\n"))
+    monkeypatch.chdir(tmp_path)
+    actions = Actions()
+    searched = []
+
+    def fake_iter_qlever_processes(binaries):
+        searched.extend(binaries)
+        return iter([])
+
+    monkeypatch.setattr(qlever.qlever_old, "iter_qlever_processes",
+                        fake_iter_qlever_processes)
+    actions.action_status()
+    assert sorted(searched) == ["IndexBuilderMain", "ServerMain",
+                                "ServerMain-debug"]